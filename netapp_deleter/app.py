@@ -3,14 +3,19 @@ Main application module for the NetApp deleter.
 """
 
 import os
+import threading
 import concurrent.futures
-from .logging_utils import logger, RED, RST, setup_logging
+from .logging_utils import logger, RED, RST, setup_logging, stop_logging
 from .azure_utils import get_azure_clients
 from .resource_deleter import delete_netapp_resources
 
 
 def list_and_delete_netapp_accounts(
-    netapp_client, resource_client, skip_confirmation: bool, max_workers: int
+    netapp_client,
+    resource_client,
+    skip_confirmation: bool,
+    max_workers: int,
+    verify_deletion: bool = False,
 ):
     """
     List and delete all NetApp accounts in the current subscription.
@@ -20,21 +25,26 @@ def list_and_delete_netapp_accounts(
         resource_client: The resource management client
         skip_confirmation: Whether to skip the confirmation prompt
         max_workers: Maximum number of concurrent workers
+        verify_deletion: Whether to confirm each backup vault is gone after deletion
     """
     logger.info("Fetching and deleting NetApp accounts...")
     try:
         # Get all NetApp accounts directly
         logger.info("Listing all NetApp accounts in subscription...")
-        netapp_accounts = list(netapp_client.accounts.list_by_subscription())
+        netapp_accounts = netapp_client.accounts.list_by_subscription()
 
-        if not netapp_accounts:
-            logger.info("No NetApp accounts found in subscription.")
-            return
-
-        logger.info(
-            f"Found {len(netapp_accounts)} NetApp accounts to delete: {', '.join([x.name for x in netapp_accounts])}"
-        )
         if not skip_confirmation:
+            # The confirmation prompt needs the full list of accounts up front
+            netapp_accounts = list(netapp_accounts)
+            if not netapp_accounts:
+                logger.info("No NetApp accounts found in subscription.")
+                return
+
+            logger.info(
+                "Found %s NetApp accounts to delete: %s",
+                len(netapp_accounts),
+                ", ".join([x.name for x in netapp_accounts]),
+            )
             response = input(
                 f"This will delete all {len(netapp_accounts)} NetApp accounts in your subscription. Are you sure you want to proceed? y/N: "
             )
@@ -42,30 +52,53 @@ def list_and_delete_netapp_accounts(
                 logger.info("Operation cancelled by user.")
                 return
 
-        # Delete accounts in parallel
+        # Set when one account fails, so the other workers stop at their next check
+        cancel_event = threading.Event()
+
+        # Delete accounts in parallel, starting each one as soon as its page of
+        # results arrives rather than after the whole subscription has been listed
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_account = {
-                executor.submit(
-                    delete_netapp_resources, netapp_client, resource_client, account.id
-                ): account
-                for account in netapp_accounts
-            }
-
-            for future in concurrent.futures.as_completed(future_to_account):
+            future_to_account = {}
+            for account in netapp_accounts:
+                if skip_confirmation:
+                    logger.info("Found NetApp account to delete: %s", account.name)
+                future = executor.submit(
+                    delete_netapp_resources,
+                    netapp_client,
+                    resource_client,
+                    account.id,
+                    cancel_event,
+                    max_workers,
+                    verify_deletion,
+                )
+                future_to_account[future] = account
+
+            if not future_to_account:
+                logger.info("No NetApp accounts found in subscription.")
+                return
+
+            # Wait until every account is deleted or the first one fails
+            done, not_done = concurrent.futures.wait(
+                future_to_account, return_when=concurrent.futures.FIRST_EXCEPTION
+            )
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    continue
                 account = future_to_account[future]
-                try:
-                    future.result()  # This will raise any exceptions that occurred
-                except Exception as e:
-                    logger.error(
-                        f"{RED}Failed to delete NetApp account {account.name}: {str(e)}{RST}"
-                    )
-                    # Cancel all pending futures
-                    for f in future_to_account:
-                        f.cancel()
-                    raise  # Re-raise to trigger early termination
+                logger.error(
+                    f"{RED}Failed to delete NetApp account %s: %s{RST}",
+                    account.name,
+                    error,
+                )
+                # Stop running workers and cancel the accounts not started yet
+                cancel_event.set()
+                for f in not_done:
+                    f.cancel()
+                raise error  # Re-raise to trigger early termination
 
     except Exception as e:
-        logger.error(f"{RED}Error in list_and_delete_netapp_accounts: {str(e)}{RST}")
+        logger.error(f"{RED}Error in list_and_delete_netapp_accounts: %s{RST}", e)
         raise  # Re-raise to trigger early termination
 
 
@@ -90,6 +123,18 @@ def main():
         help="Enable verbose logging",
         default=False,
     )
+    parser.add_argument(
+        "--trace-http",
+        action="store_true",
+        help="Enable Azure SDK logging of every HTTP request and response",
+        default=False,
+    )
+    parser.add_argument(
+        "--verify-deletion",
+        action="store_true",
+        help="Confirm each backup vault is gone with an extra request after deleting it",
+        default=False,
+    )
     parser.add_argument(
         "-w",
         "--workers",
@@ -99,7 +144,7 @@ def main():
     )
     args = parser.parse_args()
 
-    setup_logging(args.verbose)
+    setup_logging(args.verbose, args.trace_http)
 
     try:
         # Unset REQUESTS_CA_BUNDLE environment variable
@@ -107,14 +152,24 @@ def main():
             del os.environ["REQUESTS_CA_BUNDLE"]
 
         # Initialize credentials and clients
-        netapp_client, resource_client = get_azure_clients()
-
-        list_and_delete_netapp_accounts(
-            netapp_client, resource_client, args.yes, args.workers
-        )
+        netapp_client, resource_client = get_azure_clients(args.workers)
+
+        # Keep the clients (and their shared connection pool) open for the whole
+        # run and close their sockets when done
+        with netapp_client, resource_client:
+            list_and_delete_netapp_accounts(
+                netapp_client,
+                resource_client,
+                args.yes,
+                args.workers,
+                args.verify_deletion,
+            )
     except Exception as e:
-        logger.error(f"{RED}Script terminated due to error: {str(e)}{RST}")
+        logger.error(f"{RED}Script terminated due to error: %s{RST}", e)
         exit(1)
+    finally:
+        # Write out any queued log records before the process exits
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -2,18 +2,137 @@
 Azure utilities for the NetApp deleter.
 """
 
+import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
+from azure.mgmt.core.polling.arm_polling import ARMPolling
 from azure.mgmt.netapp import NetAppManagementClient
 from azure.mgmt.resource import ResourceManagementClient
 from azure.mgmt.resource.subscriptions import SubscriptionClient
 from .logging_utils import logger
 
+try:
+    # Optional: with HTTP/2 support installed, concurrent requests to ARM are
+    # multiplexed over a few connections instead of needing one socket each
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+    import httpx
+    from azure.core.experimental.transport import HttpXTransport
+except ImportError:
+    httpx = None
 
-def get_subscription_id():
-    """Get the current subscription ID using Azure SDK"""
+# Minimum size of the HTTPS connection pool shared by all Azure clients
+HTTP_POOL_SIZE = 64
+
+# Concurrent requests a single account deletion can have in flight
+CONNECTIONS_PER_ACCOUNT = 16
+
+# Seconds to wait when opening a connection to ARM
+CONNECTION_TIMEOUT = 10
+
+# Status polling of long-running operations starts tight and backs off: 2s, 3s,
+# 4.5s, ... capped at 30s (the SDK default). Short deletes are observed within a
+# couple of seconds, while long ones don't keep hammering ARM with status GETs.
+LRO_INITIAL_DELAY = 2  # seconds
+LRO_BACKOFF_FACTOR = 1.5
+LRO_MAX_DELAY = 30  # seconds
+
+# Subscription ID resolved by get_subscription_id, cached for the whole run
+_subscription_id = None
+
+
+class BackoffPolling(ARMPolling):
+    """
+    ARM polling method whose delay between status checks grows exponentially.
+
+    A Retry-After header sent by ARM still takes precedence, as with the SDK's
+    default polling. Pass a new instance as `polling=` to each begin_* call,
+    since it counts the polls of a single operation.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(timeout=LRO_INITIAL_DELAY, **kwargs)
+        self._poll_count = 0
+
+    def _extract_delay(self):
+        self._timeout = min(
+            LRO_MAX_DELAY, LRO_INITIAL_DELAY * LRO_BACKOFF_FACTOR**self._poll_count
+        )
+        self._poll_count += 1
+        return super()._extract_delay()
+
+
+def get_transport(max_workers=1):
+    """
+    Build an HTTP transport that all Azure clients can share.
+
+    Uses an HTTP/2 httpx client when the optional azure-core-experimental and
+    httpx[http2] packages are installed, and a pooled requests session otherwise.
+
+    Args:
+        max_workers: Number of accounts that will be deleted concurrently
+    """
+    pool_size = max(HTTP_POOL_SIZE, max_workers * CONNECTIONS_PER_ACCOUNT)
+
+    if httpx is not None:
+        logger.debug("Using HTTP/2 transport")
+        client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=pool_size),
+        )
+        return HttpXTransport(client=client)
+
+    # Over HTTP/1.1 every in-flight request holds its own connection, so size
+    # the pool for the full fan-out so workers never wait for a free socket
+    session = requests.Session()
+    # Retries are handled by the Azure SDK's retry policy, so disable urllib3's
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(session=session, connection_timeout=CONNECTION_TIMEOUT)
+
+
+def get_credential():
+    """Build a credential that skips sources this tool is never run with"""
+    # DefaultAzureCredential probes each source in turn until one succeeds, so
+    # excluding desktop-only sources avoids slow failed probes before the CLI login
+    return DefaultAzureCredential(
+        exclude_interactive_browser_credential=True,
+        exclude_visual_studio_code_credential=True,
+        exclude_shared_token_cache_credential=True,
+        exclude_powershell_credential=True,
+    )
+
+
+def get_subscription_id(credential=None, transport=None):
+    """Get the current subscription ID, from AZURE_SUBSCRIPTION_ID or the Azure SDK"""
+    global _subscription_id
+    if _subscription_id:
+        return _subscription_id
+
+    # Skip listing subscriptions when the caller has already chosen one
+    _subscription_id = os.environ.get("AZURE_SUBSCRIPTION_ID")
+    if _subscription_id:
+        return _subscription_id
+
+    _subscription_id = _find_subscription_id(credential, transport)
+    return _subscription_id
+
+
+def _find_subscription_id(credential, transport):
+    """Look up the subscription ID to use with the Azure SDK"""
     try:
-        credential = DefaultAzureCredential()
-        subscription_client = SubscriptionClient(credential)
+        credential = credential or get_credential()
+        subscription_client = SubscriptionClient(
+            credential, transport=transport or get_transport()
+        )
 
         # Get the first subscription (usually the default one)
         subscriptions = list(subscription_client.subscriptions.list())
@@ -38,10 +157,15 @@ def get_subscription_id():
         raise ValueError(f"Failed to get subscription ID: {str(e)}")
 
 
-def get_azure_clients():
-    """Initialize and return Azure clients"""
-    credential = DefaultAzureCredential()
-    subscription_id = get_subscription_id()
-    netapp_client = NetAppManagementClient(credential, subscription_id)
-    resource_client = ResourceManagementClient(credential, subscription_id)
+def get_azure_clients(max_workers=1):
+    """Initialize and return Azure clients sharing one credential and transport"""
+    credential = get_credential()
+    transport = get_transport(max_workers)
+    subscription_id = get_subscription_id(credential, transport)
+    netapp_client = NetAppManagementClient(
+        credential, subscription_id, transport=transport
+    )
+    resource_client = ResourceManagementClient(
+        credential, subscription_id, transport=transport
+    )
     return netapp_client, resource_client
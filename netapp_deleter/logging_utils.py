@@ -2,36 +2,61 @@
 Logging utilities for the NetApp deleter.
 """
 
+import sys
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-# Set up logging
+# Set up logging. Records are formatted by the thread that logs them and put on
+# a queue; a single listener thread writes them out, so worker threads never
+# block on the terminal.
+_log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_stream = sys.stderr
+_listener = QueueListener(_log_queue, logging.StreamHandler(_log_stream))
+_listener_started = False
 logger = logging.getLogger(__name__)
 
-# Color codes for terminal output
-RED = "\033[0;31m"
-GRN = "\033[0;32m"
-RST = "\033[0m"
+# Color codes for terminal output, left empty when logs are redirected to a file
+# or CI log so escape sequences don't end up in the output
+if _log_stream.isatty():
+    RED = "\033[0;31m"
+    GRN = "\033[0;32m"
+    RST = "\033[0m"
+else:
+    RED = GRN = RST = ""
 
 
-def setup_logging(verbose):
+def setup_logging(verbose, trace_http=False):
     """Configure logging based on verbosity level"""
+    global _listener_started
+    if not _listener_started:
+        _listener.start()
+        _listener_started = True
+
     if verbose:
         logger.setLevel(logging.DEBUG)
-        # Enable Azure SDK debug logging
-        logging.getLogger("azure").setLevel(logging.DEBUG)
-        logging.getLogger("azure.core.pipeline.policies.http_logging_policy").setLevel(
-            logging.DEBUG
-        )
     else:
         logger.setLevel(logging.INFO)
-        # Silence Azure SDK debug logging
-        logging.getLogger("azure").setLevel(logging.WARNING)
-        logging.getLogger("azure.core.pipeline.policies.http_logging_policy").setLevel(
-            logging.WARNING
-        )
-        logging.getLogger("azure.identity").setLevel(logging.WARNING)
+
+    # Azure SDK logging includes every HTTP request and response, which is costly
+    # across the many status polls of each delete, so it has its own flag
+    azure_level = logging.DEBUG if trace_http else logging.WARNING
+    logging.getLogger("azure").setLevel(azure_level)
+    logging.getLogger("azure.core.pipeline.policies.http_logging_policy").setLevel(
+        azure_level
+    )
+    logging.getLogger("azure.identity").setLevel(azure_level)
+
+
+def stop_logging():
+    """Write out any queued log records and stop the listener thread"""
+    global _listener_started
+    if _listener_started:
+        _listener.stop()
+        _listener_started = False
@@ -0,0 +1,43 @@
+"""
+Rate limiting for Azure Resource Manager requests.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    The bucket holds up to `capacity` tokens and refills continuously at
+    `refill_per_sec` tokens per second. Each request takes one token, waiting
+    for the bucket to refill when it is empty.
+
+    Args:
+        capacity: Maximum number of tokens the bucket can hold
+        refill_per_sec: Number of tokens added back per second
+    """
+
+    def __init__(self, capacity, refill_per_sec):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, blocking until one is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last_refill) * self.refill_per_sec,
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.refill_per_sec
+            time.sleep(wait)
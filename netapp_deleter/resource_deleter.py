@@ -2,200 +2,611 @@
 NetApp resource deletion logic.
 """
 
-import time
+import re
+import random
+import threading
+import concurrent.futures
 from azure.core.exceptions import ResourceNotFoundError
+from .azure_utils import BackoffPolling
 from .logging_utils import logger, RED, GRN, RST
+from .rate_limiter import TokenBucket
 
+# Matches the resource group and account name in a NetApp account resource ID
+_ACCOUNT_ID_RE = re.compile(r"/resourceGroups/([^/]+)/.*/([^/]+)$", re.IGNORECASE)
 
-def delete_netapp_resources(netapp_client, resource_client, netapp_account_id):
+# Colored log templates, built once so per-item messages are formatted lazily
+_DELETED = f"{GRN}Successfully deleted %s '%s'{RST}"
+_DELETE_FAILED = f"{RED}Error deleting %s '%s': %s{RST}"
+
+# Maximum number of threads used to issue list requests concurrently
+MAX_LIST_WORKERS = 8
+
+# Seconds between sweeps over in-flight deletions for ones that have finished
+COMPLETION_SWEEP_INTERVAL = 2
+
+# Exponential backoff for retrying the account delete while nested resources are
+# still being torn down. Delays run 1s, 2s, 4s, ... capped at 30s, each stretched
+# by up to 50% of random jitter so parallel workers don't retry in lockstep.
+ACCOUNT_DELETE_MAX_RETRIES = 7
+RETRY_BASE_DELAY = 1  # seconds
+RETRY_MAX_DELAY = 30  # seconds
+RETRY_JITTER = 0.5
+
+# Every delete request, from any worker thread, takes a token from this bucket.
+# It mirrors ARM's subscription-wide delete throttling (a burst of 200 requests,
+# refilled at 10 per second), so deletes are paced instead of hitting 429s.
+delete_rate_limiter = TokenBucket(capacity=200, refill_per_sec=10)
+
+# Seconds between checks for cancellation while waiting on a delete
+CANCEL_CHECK_INTERVAL = 3
+
+
+class DeletionCancelledError(Exception):
+    """Raised when a deletion is abandoned because another deletion failed"""
+
+
+class DeletionFailedError(Exception):
     """
-    Delete all resources associated with a NetApp account.
+    Raised after every independent deletion was attempted and some failed.
 
     Args:
-        netapp_client: The NetApp management client
-        resource_client: The resource management client
-        netapp_account_id: The ID of the NetApp account to delete
+        message: Summary of what was being deleted
+        errors: The errors of the failed deletions. Nested DeletionFailedErrors
+            are flattened into their individual errors.
     """
-    # Extract resource group name and account name from the NetApp account ID
-    parts = netapp_account_id.split("/")
-    resource_group_name = parts[4]
-    netapp_account_name = parts[-1]
 
+    def __init__(self, message, errors):
+        self.errors = []
+        for error in errors:
+            if isinstance(error, DeletionFailedError):
+                self.errors.extend(error.errors)
+            else:
+                self.errors.append(error)
+        super().__init__(f"{message} ({len(self.errors)} failed)")
+
+
+def _raise_if_cancelled(cancel_event):
+    """Raise DeletionCancelledError if cancellation has been requested"""
+    if cancel_event.is_set():
+        raise DeletionCancelledError("Deletion cancelled after another failure")
+
+
+def _wait_for_poller(poller, cancel_event):
+    """
+    Wait for a long-running operation, giving up early if cancelled.
+
+    Args:
+        poller: The poller returned by a begin_delete call
+        cancel_event: Event that is set when the deletion should be abandoned
+    """
+    while not poller.done():
+        _raise_if_cancelled(cancel_event)
+        poller.wait(timeout=CANCEL_CHECK_INTERVAL)
+    return poller.result()
+
+
+def _wait_for_deletions(pollers, resource_type, cancel_event):
+    """
+    Wait for a batch of already-started deletions to complete.
+
+    The in-flight pollers are swept as a set: every deletion that has finished
+    since the last sweep is handled, so results (and failures) surface in the
+    order the operations complete rather than the order they were started.
+    A failed deletion is logged and the rest are still waited on; the errors
+    of all failed deletions are returned.
+
+    Args:
+        pollers: List of (name, poller) tuples returned by begin_delete calls
+        resource_type: The type of resource being deleted, used for logging
+        cancel_event: Event that is set when the deletion should be abandoned
+    """
+    info = logger.info  # Bound once, called for every finished deletion
+    errors = []
+    inflight = list(pollers)
+    while inflight:
+        _raise_if_cancelled(cancel_event)
+        still_running = []
+        for name, poller in inflight:
+            if not poller.done():
+                still_running.append((name, poller))
+                continue
+            try:
+                poller.result()  # Doesn't block once done, raises if it failed
+                info(_DELETED, resource_type, name)
+            except Exception as e:
+                logger.error(_DELETE_FAILED, resource_type, name, e)
+                errors.append(e)
+        inflight = still_running
+        if inflight:
+            cancel_event.wait(COMPLETION_SWEEP_INTERVAL)
+    return errors
+
+
+def _wait_for_tasks(futures, message):
+    """
+    Wait for independent tasks running on an executor to all finish.
+
+    A failing task doesn't stop the others. Once all are done, the failures
+    are raised together as a DeletionFailedError, unless the deletion was
+    cancelled, in which case DeletionCancelledError is raised.
+
+    Args:
+        futures: The futures of the submitted tasks
+        message: Summary used for the DeletionFailedError if any task failed
+    """
+    concurrent.futures.wait(futures)
+    errors = [f.exception() for f in futures if f.exception() is not None]
+    for error in errors:
+        if isinstance(error, DeletionCancelledError):
+            raise error
+    if errors:
+        raise DeletionFailedError(message, errors)
+
+
+def _parse_account_id(netapp_account_id):
+    """Return the (resource group name, account name) of a NetApp account ID"""
+    match = _ACCOUNT_ID_RE.search(netapp_account_id)
+    if not match:
+        raise ValueError(f"Invalid NetApp account ID: '{netapp_account_id}'")
+    return match.group(1), match.group(2)
+
+
+def _list(list_method, *args):
+    """Call a paged list operation and materialize all of its items"""
+    return list(list_method(*args))
+
+
+def _is_transient_error(error):
+    """Return True if a failed account delete is worth retrying"""
+    # Nested resources can linger briefly after their own deletes report success;
+    # any other failure will not resolve itself by waiting
+    return "Cannot delete resource while nested resources exist" in str(error)
+
+
+def _backoff_delay(attempt):
+    """Return the number of seconds to wait before the given retry attempt"""
+    delay = RETRY_BASE_DELAY * 2**attempt * (1 + random.random() * RETRY_JITTER)
+    return min(RETRY_MAX_DELAY, delay)
+
+
+def _delete_all_volumes(
+    netapp_client, resource_group_name, netapp_account_name, cancel_event
+):
+    """
+    Delete every volume in every capacity pool of a NetApp account.
+
+    Args:
+        netapp_client: The NetApp management client
+        resource_group_name: The resource group containing the account
+        netapp_account_name: The name of the NetApp account
+        cancel_event: Event that is set when the deletion should be abandoned
+    """
+    logger.info("Deleting volumes in NetApp account '%s'...", netapp_account_name)
     try:
-        # First, list and delete all volumes in the account
-        logger.info(f"Deleting volumes in NetApp account '{netapp_account_name}'...")
-        try:
-            # List all pools in the account
-            pools = netapp_client.pools.list(resource_group_name, netapp_account_name)
-            for pool in pools:
-                # List and delete all volumes in each pool
-                volumes = netapp_client.volumes.list(
-                    resource_group_name, netapp_account_name, pool.name
-                )
+        # List all pools in the account, then the volumes of every pool concurrently.
+        # Nested names come back as "account/pool" and "account/pool/volume".
+        pool_names = [
+            pool.name.rpartition("/")[2]
+            for pool in netapp_client.pools.list(
+                resource_group_name, netapp_account_name
+            )
+        ]
+        if not pool_names:
+            logger.info("No capacity pools in NetApp account '%s'", netapp_account_name)
+            return
+
+        # One list request per pool is in flight at once, up to the worker limit.
+        # A failed list or delete is recorded and the remaining volumes are still
+        # deleted; the failures are raised together once all deletes finish.
+        info = logger.info  # Bound once, called for every volume
+        errors = []
+        pollers = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(MAX_LIST_WORKERS, len(pool_names))
+        ) as executor:
+            list_futures = {
+                executor.submit(
+                    _list,
+                    netapp_client.volumes.list,
+                    resource_group_name,
+                    netapp_account_name,
+                    pool_name,
+                ): pool_name
+                for pool_name in pool_names
+            }
+
+            # Start deleting a pool's volumes as soon as its listing arrives, so
+            # the remaining listings overlap with the deletes already in flight
+            for future in concurrent.futures.as_completed(list_futures):
+                pool_name = list_futures[future]
+                try:
+                    volumes = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"{RED}Error listing volumes in pool '%s': %s{RST}",
+                        pool_name,
+                        e,
+                    )
+                    errors.append(e)
+                    continue
                 for volume in volumes:
-                    logger.info(
-                        f"  Deleting volume '{volume.name}' in pool '{pool.name}'..."
+                    delete_rate_limiter.acquire()
+                    _raise_if_cancelled(cancel_event)
+                    volume_name = volume.name.rpartition("/")[2]
+                    info(
+                        "  Deleting volume '%s' in pool '%s'...",
+                        volume_name,
+                        pool_name,
                     )
                     try:
                         poller = netapp_client.volumes.begin_delete(
                             resource_group_name,
                             netapp_account_name,
-                            pool.name,
-                            volume.name,
-                        )
-                        poller.result()  # Wait for deletion to complete
-                        logger.info(
-                            f"{GRN}Successfully deleted volume '{volume.name}'{RST}"
+                            pool_name,
+                            volume_name,
+                            polling=BackoffPolling(),
                         )
                     except Exception as e:
-                        logger.error(
-                            f"{RED}Error deleting volume '{volume.name}': {str(e)}{RST}"
-                        )
-                        raise  # Re-raise to trigger early termination
-        except Exception as e:
-            logger.error(f"{RED}Error listing/deleting volumes: {str(e)}{RST}")
-            raise  # Re-raise to trigger early termination
+                        logger.error(_DELETE_FAILED, "volume", volume_name, e)
+                        errors.append(e)
+                        continue
+                    pollers.append((volume_name, poller))
+
+        # Wait on the deletions of every pool together
+        errors.extend(_wait_for_deletions(pollers, "volume", cancel_event))
+        if errors:
+            raise DeletionFailedError("Failed to delete volumes", errors)
+    except DeletionCancelledError:
+        raise
+    except Exception as e:
+        logger.error(f"{RED}Error listing/deleting volumes: %s{RST}", e)
+        raise  # Re-raise to trigger early termination
+
+
+def _delete_backup_vault(
+    netapp_client,
+    resource_group_name,
+    netapp_account_name,
+    vault_name,
+    cancel_event,
+    verify_deletion=False,
+):
+    """
+    Delete all backups in a backup vault, then the vault itself.
+
+    Args:
+        netapp_client: The NetApp management client
+        resource_group_name: The resource group containing the account
+        netapp_account_name: The name of the NetApp account
+        vault_name: The name of the backup vault
+        cancel_event: Event that is set when the deletion should be abandoned
+        verify_deletion: Whether to confirm the vault is gone with an extra GET
+    """
+    logger.info("Processing backup vault '%s'...", vault_name)
 
-        # Delete backup vaults
-        logger.info(
-            f"Deleting backup vaults in NetApp account '{netapp_account_name}'..."
+    try:
+        # First, list and delete all backups in the vault. Deletions are started
+        # as each page of backups arrives instead of after the full listing.
+        logger.info("Listing backups in vault '%s'...", vault_name)
+        backups = netapp_client.backups.list_by_vault(
+            resource_group_name, netapp_account_name, vault_name
         )
-        try:
-            # List backup vaults using the correct API
-            backup_vaults = netapp_client.backup_vaults.list_by_net_app_account(
-                resource_group_name, netapp_account_name
+
+        # Start every backup deletion, then wait on them together. A failed
+        # delete is recorded and the remaining backups are still deleted.
+        info = logger.info  # Bound once, called for every backup
+        errors = []
+        pollers = []
+        for backup in backups:
+            delete_rate_limiter.acquire()
+            _raise_if_cancelled(cancel_event)
+            backup_name = backup.name.rpartition("/")[2]
+            info("Deleting backup '%s'...", backup_name)
+            try:
+                poller = netapp_client.backups.begin_delete(
+                    resource_group_name,
+                    netapp_account_name,
+                    vault_name,
+                    backup_name,
+                    polling=BackoffPolling(),
+                )
+            except Exception as e:
+                logger.error(_DELETE_FAILED, "backup", backup_name, e)
+                errors.append(e)
+                continue
+            pollers.append((backup_name, poller))
+
+        if pollers:
+            logger.info(
+                "Waiting for %s backups to be deleted in vault '%s'",
+                len(pollers),
+                vault_name,
             )
+            errors.extend(_wait_for_deletions(pollers, "backup", cancel_event))
+        elif not errors:
+            logger.info("No backups found in vault '%s'", vault_name)
 
-            # Process each vault found
-            for vault in backup_vaults:
-                # Extract the actual vault name from the format "account_name/vault_name"
-                vault_name = vault.name.split("/")[-1]
-                logger.info(f"Processing backup vault '{vault_name}'...")
+        # The vault can't be deleted while any of its backups remain
+        if errors:
+            raise DeletionFailedError(
+                f"Failed to delete backups in vault '{vault_name}'", errors
+            )
+
+        # Now delete the vault itself
+        logger.info("Deleting backup vault '%s'...", vault_name)
+        try:
+            delete_rate_limiter.acquire()
+            poller = netapp_client.backup_vaults.begin_delete(
+                resource_group_name,
+                netapp_account_name,
+                vault_name,
+                polling=BackoffPolling(),
+            )
+            _wait_for_poller(poller, cancel_event)
 
+            # The poller only returns once the service reports the delete
+            # succeeded, so re-checking for the vault is opt-in
+            if verify_deletion:
                 try:
-                    # First, list and delete all backups in the vault
-                    logger.info(f"Listing backups in vault '{vault_name}'...")
-                    backups = list(
-                        netapp_client.backups.list_by_vault(
-                            resource_group_name, netapp_account_name, vault_name
-                        )
+                    logger.info(
+                        "Verifying NetApp has disassociated from vault '%s'...",
+                        vault_name,
                     )
+                    netapp_client.backup_vaults.get(
+                        resource_group_name, netapp_account_name, vault_name
+                    )
+                    logger.error(
+                        f"{RED}Backup vault '%s' still exists after deletion{RST}",
+                        vault_name,
+                    )
+                    raise Exception(
+                        f"Backup vault '{vault_name}' deletion failed - resource still exists"
+                    )
+                except ResourceNotFoundError:
+                    pass
+            logger.info(_DELETED, "backup vault", vault_name)
+        except DeletionCancelledError:
+            raise
+        except Exception as e:
+            logger.error(_DELETE_FAILED, "backup vault", vault_name, e)
+            raise  # Re-raise to trigger early termination
 
-                    if backups:
-                        logger.info(
-                            f"Found {len(backups)} backups to delete in vault '{vault_name}'"
-                        )
-                        for backup in backups:
-                            backup_name = backup.name.split("/")[-1]
-                            logger.info(f"Deleting backup '{backup_name}'...")
-                            try:
-                                poller = netapp_client.backups.begin_delete(
-                                    resource_group_name,
-                                    netapp_account_name,
-                                    vault_name,
-                                    backup_name,
-                                )
-                                poller.result()  # Wait for deletion to complete
-                                logger.info(
-                                    f"{GRN}Successfully deleted backup '{backup_name}'{RST}"
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"{RED}Error deleting backup '{backup_name}': {str(e)}{RST}"
-                                )
-                                raise  # Re-raise to trigger early termination
-                    else:
-                        logger.info(f"No backups found in vault '{vault_name}'")
-
-                    # Now delete the vault itself
-                    logger.info(f"Deleting backup vault '{vault_name}'...")
-                    try:
-                        poller = netapp_client.backup_vaults.begin_delete(
-                            resource_group_name, netapp_account_name, vault_name
-                        )
-                        poller.result()  # Wait for deletion to complete
-
-                        # Verify the vault is actually deleted
-                        try:
-                            print(
-                                f"Verifying netapp has disassociated with the vault..."
-                            )
-                            netapp_client.backup_vaults.get(
-                                resource_group_name, netapp_account_name, vault_name
-                            )
-                            logger.error(
-                                f"{RED}Backup vault '{vault_name}' still exists after deletion{RST}"
-                            )
-                            raise Exception(
-                                f"Backup vault '{vault_name}' deletion failed - resource still exists"
-                            )
-                        except ResourceNotFoundError:
-                            logger.info(
-                                f"{GRN}Successfully deleted backup vault '{vault_name}'{RST}"
-                            )
-                    except Exception as e:
-                        logger.error(
-                            f"{RED}Error deleting backup vault '{vault_name}': {str(e)}{RST}"
-                        )
-                        raise  # Re-raise to trigger early termination
+    except DeletionCancelledError:
+        raise
+    except Exception as e:
+        logger.error(f"{RED}Error processing backup vault '%s': %s{RST}", vault_name, e)
+        raise  # Re-raise to trigger early termination
 
-                except Exception as e:
-                    logger.error(
-                        f"{RED}Error processing backup vault '{vault_name}': {str(e)}{RST}"
+
+def _delete_all_vaults(
+    netapp_client,
+    resource_group_name,
+    netapp_account_name,
+    cancel_event,
+    max_workers,
+    verify_deletion=False,
+):
+    """
+    Delete every backup vault (and the backups in it) in a NetApp account.
+
+    Args:
+        netapp_client: The NetApp management client
+        resource_group_name: The resource group containing the account
+        netapp_account_name: The name of the NetApp account
+        cancel_event: Event that is set when the deletion should be abandoned
+        max_workers: Maximum number of vaults to delete concurrently
+        verify_deletion: Whether to confirm each vault is gone with an extra GET
+    """
+    logger.info("Deleting backup vaults in NetApp account '%s'...", netapp_account_name)
+    try:
+        # List backup vaults using the correct API
+        backup_vaults = netapp_client.backup_vaults.list_by_net_app_account(
+            resource_group_name, netapp_account_name
+        )
+
+        # Extract the actual vault name from the format "account_name/vault_name"
+        vault_names = [vault.name.rpartition("/")[2] for vault in backup_vaults]
+
+        # Vaults are independent of each other, so process them in parallel
+        if vault_names:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _delete_backup_vault,
+                        netapp_client,
+                        resource_group_name,
+                        netapp_account_name,
+                        vault_name,
+                        cancel_event,
+                        verify_deletion,
                     )
-                    raise  # Re-raise to trigger early termination
+                    for vault_name in vault_names
+                ]
+                _wait_for_tasks(futures, "Failed to delete backup vaults")
+    except DeletionCancelledError:
+        raise
+    except Exception as e:
+        logger.error(f"{RED}Error listing/deleting backup vaults: %s{RST}", e)
+        raise  # Re-raise to trigger early termination
 
+
+def _delete_account(
+    netapp_client, resource_group_name, netapp_account_name, cancel_event
+):
+    """
+    Delete a NetApp account, retrying while its nested resources drain.
+
+    Args:
+        netapp_client: The NetApp management client
+        resource_group_name: The resource group containing the account
+        netapp_account_name: The name of the NetApp account
+        cancel_event: Event that is set when the deletion should be abandoned
+    """
+    logger.info("Deleting NetApp account '%s'...", netapp_account_name)
+    max_retries = ACCOUNT_DELETE_MAX_RETRIES
+
+    for attempt in range(max_retries):
+        try:
+            delete_rate_limiter.acquire()
+            poller = netapp_client.accounts.begin_delete(
+                resource_group_name,
+                netapp_account_name,
+                polling=BackoffPolling(),
+            )
+            _wait_for_poller(poller, cancel_event)
+            logger.info(_DELETED, "NetApp account", netapp_account_name)
+            break  # Success, exit retry loop
+        except DeletionCancelledError:
+            raise
         except Exception as e:
-            logger.error(f"{RED}Error listing/deleting backup vaults: {str(e)}{RST}")
+            if _is_transient_error(e) and attempt < max_retries - 1:
+                retry_delay = _backoff_delay(attempt)
+                logger.info(
+                    "Account deletion failed due to nested resources, waiting %.1f seconds before retry %s/%s...",
+                    retry_delay,
+                    attempt + 1,
+                    max_retries,
+                )
+                # Wake early if the deletion is abandoned while backing off
+                cancel_event.wait(retry_delay)
+                _raise_if_cancelled(cancel_event)
+                continue
+            logger.error(_DELETE_FAILED, "NetApp account", netapp_account_name, e)
             raise  # Re-raise to trigger early termination
 
-        # Then delete the account itself
-        logger.info(f"Deleting NetApp account '{netapp_account_name}'...")
-        max_retries = 3
-        retry_delay = 30  # seconds
 
-        for attempt in range(max_retries):
+def _delete_resource_group(resource_client, resource_group_name, cancel_event):
+    """
+    Delete a resource group.
+
+    Args:
+        resource_client: The resource management client
+        resource_group_name: The name of the resource group to delete
+        cancel_event: Event that is set when the deletion should be abandoned
+    """
+    logger.info("Deleting resource group '%s'...", resource_group_name)
+    try:
+        delete_rate_limiter.acquire()
+        poller = resource_client.resource_groups.begin_delete(
+            resource_group_name, polling=BackoffPolling()
+        )
+        _wait_for_poller(poller, cancel_event)
+        logger.info(_DELETED, "resource group", resource_group_name)
+    except DeletionCancelledError:
+        raise
+    except Exception as e:
+        logger.error(_DELETE_FAILED, "resource group", resource_group_name, e)
+        raise  # Re-raise to trigger early termination
+
+
+def _is_dedicated_resource_group(
+    resource_client, resource_group_name, netapp_account_id
+):
+    """Return True if a resource group holds nothing but the given NetApp account"""
+    account_id = netapp_account_id.lower()
+    for resource in resource_client.resources.list_by_resource_group(
+        resource_group_name
+    ):
+        resource_id = resource.id.lower()
+        # Stop at the first resource that isn't the account or nested under it
+        if resource_id != account_id and not resource_id.startswith(account_id + "/"):
+            return False
+    return True
+
+
+def delete_netapp_resources(
+    netapp_client,
+    resource_client,
+    netapp_account_id,
+    cancel_event=None,
+    max_workers=1,
+    verify_deletion=False,
+):
+    """
+    Delete all resources associated with a NetApp account.
+
+    Args:
+        netapp_client: The NetApp management client
+        resource_client: The resource management client
+        netapp_account_id: The ID of the NetApp account to delete
+        cancel_event: Optional event that, once set, makes the deletion stop at
+            its next check and raise DeletionCancelledError
+        max_workers: Maximum number of backup vaults to delete concurrently
+        verify_deletion: Whether to confirm each backup vault is gone with an
+            extra GET after its delete reports success
+    """
+    if cancel_event is None:
+        cancel_event = threading.Event()
+
+    # Extract resource group name and account name from the NetApp account ID
+    resource_group_name, netapp_account_name = _parse_account_id(netapp_account_id)
+
+    try:
+        # If the resource group holds nothing but this account, deleting the group
+        # removes everything nested in it in a single server-side operation
+        if _is_dedicated_resource_group(
+            resource_client, resource_group_name, netapp_account_id
+        ):
+            logger.info(
+                "Resource group '%s' only contains NetApp account '%s'",
+                resource_group_name,
+                netapp_account_name,
+            )
             try:
-                poller = netapp_client.accounts.begin_delete(
-                    resource_group_name, netapp_account_name
+                _delete_resource_group(
+                    resource_client, resource_group_name, cancel_event
                 )
-                poller.result()  # Wait for deletion to complete
+                return
+            except DeletionCancelledError:
+                raise
+            except Exception:
                 logger.info(
-                    f"{GRN}Successfully deleted NetApp account '{netapp_account_name}'{RST}"
-                )
-                break  # Success, exit retry loop
-            except Exception as e:
-                error_str = str(e)
-                if (
-                    "Cannot delete resource while nested resources exist" in error_str
-                    and attempt < max_retries - 1
-                ):
-                    logger.info(
-                        f"Account deletion failed due to nested resources, waiting {retry_delay} seconds before retry {attempt + 1}/{max_retries}..."
-                    )
-                    time.sleep(retry_delay)
-                    continue
-                logger.error(
-                    f"{RED}Error deleting NetApp account '{netapp_account_name}':{RST} {str(e)}"
+                    "Falling back to deleting the resources of NetApp account '%s' one by one...",
+                    netapp_account_name,
                 )
-                raise  # Re-raise to trigger early termination
 
-        # Finally, delete the resource group if it's empty
-        logger.info(f"Deleting resource group '{resource_group_name}'...")
-        try:
-            poller = resource_client.resource_groups.begin_delete(resource_group_name)
-            poller.result()  # Wait for deletion to complete
-            logger.info(
-                f"{GRN}Successfully deleted resource group '{resource_group_name}'{RST}"
+        # Volumes and backup vaults don't depend on each other, so tear them down
+        # in parallel. Only the account delete has to wait for both, and it is
+        # skipped if either stage failed since the account can't go while
+        # anything nested in it remains.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            stages = [
+                executor.submit(
+                    _delete_all_volumes,
+                    netapp_client,
+                    resource_group_name,
+                    netapp_account_name,
+                    cancel_event,
+                ),
+                executor.submit(
+                    _delete_all_vaults,
+                    netapp_client,
+                    resource_group_name,
+                    netapp_account_name,
+                    cancel_event,
+                    max_workers,
+                    verify_deletion,
+                ),
+            ]
+            _wait_for_tasks(
+                stages, f"Failed to delete resources in account '{netapp_account_name}'"
             )
-        except Exception as e:
-            logger.error(
-                f"{RED}Error deleting resource group '{resource_group_name}': {str(e)}{RST}"
-            )
-            raise  # Re-raise to trigger early termination
 
+        # Then delete the account itself
+        _delete_account(
+            netapp_client, resource_group_name, netapp_account_name, cancel_event
+        )
+
+        # Finally, delete the resource group if it's empty
+        _delete_resource_group(resource_client, resource_group_name, cancel_event)
+
+    except DeletionCancelledError:
+        logger.info("Stopped deleting NetApp account '%s'", netapp_account_name)
+        raise
     except Exception as e:
         logger.error(
-            f"{RED}Error processing NetApp account '{netapp_account_id}': {str(e)}{RST}"
+            f"{RED}Error processing NetApp account '%s': %s{RST}", netapp_account_id, e
         )
         raise  # Re-raise to trigger early termination
@@ -1,8 +1,28 @@
-from unittest.mock import patch, MagicMock
+import logging
+import threading
+import time
+import pytest
+from unittest.mock import ANY, patch, MagicMock
+from azure.core.exceptions import ResourceNotFoundError
 from netapp_deleter.logging_utils import setup_logging, logger
-from netapp_deleter.azure_utils import get_subscription_id, get_azure_clients
-from netapp_deleter.resource_deleter import delete_netapp_resources
+from netapp_deleter.azure_utils import (
+    BackoffPolling,
+    get_subscription_id,
+    get_azure_clients,
+)
+from netapp_deleter.resource_deleter import (
+    delete_netapp_resources,
+    RETRY_MAX_DELAY,
+    _backoff_delay,
+    _delete_backup_vault,
+    _is_transient_error,
+    _parse_account_id,
+    _wait_for_deletions,
+    _wait_for_poller,
+    DeletionCancelledError,
+)
 from netapp_deleter.app import list_and_delete_netapp_accounts
+from netapp_deleter.rate_limiter import TokenBucket
 
 
 def test_setup_logging():
@@ -15,7 +35,17 @@ def test_setup_logging():
     setup_logging(False)
     assert logger.level == 20  # INFO level
 
+    # Azure SDK HTTP logging is only enabled when explicitly requested
+    http_logger = logging.getLogger("azure.core.pipeline.policies.http_logging_policy")
+    setup_logging(True)
+    assert http_logger.level == logging.WARNING
+    setup_logging(False, trace_http=True)
+    assert http_logger.level == logging.DEBUG
+    setup_logging(False)
+
 
+@patch.dict("os.environ", clear=True)
+@patch("netapp_deleter.azure_utils._subscription_id", None)
 @patch("netapp_deleter.azure_utils.DefaultAzureCredential")
 @patch("netapp_deleter.azure_utils.SubscriptionClient")
 def test_get_subscription_id(mock_subscription_client, mock_credential):
@@ -34,6 +64,19 @@ def test_get_subscription_id(mock_subscription_client, mock_credential):
     # Verify the result
     assert result == "test-subscription-id"
 
+    # The subscription ID is cached after the first lookup
+    assert get_subscription_id() == "test-subscription-id"
+    mock_subscription_client.return_value.subscriptions.list.assert_called_once()
+
+
+@patch.dict("os.environ", {"AZURE_SUBSCRIPTION_ID": "env-subscription-id"})
+@patch("netapp_deleter.azure_utils._subscription_id", None)
+@patch("netapp_deleter.azure_utils.SubscriptionClient")
+def test_get_subscription_id_from_environment(mock_subscription_client):
+    """Test that AZURE_SUBSCRIPTION_ID is used without listing subscriptions"""
+    assert get_subscription_id() == "env-subscription-id"
+    mock_subscription_client.assert_not_called()
+
 
 @patch("netapp_deleter.azure_utils.DefaultAzureCredential")
 @patch("netapp_deleter.azure_utils.get_subscription_id")
@@ -49,13 +92,201 @@ def test_get_azure_clients(mock_get_subscription_id, mock_credential):
     assert netapp_client is not None
     assert resource_client is not None
 
+    # Verify a single credential was used for every client
+    mock_credential.assert_called_once()
+    mock_get_subscription_id.assert_called_once()
+    assert mock_get_subscription_id.call_args[0][0] is mock_credential.return_value
+
 
 @patch("netapp_deleter.resource_deleter.logger")
 def test_delete_netapp_resources(mock_logger):
     """Test delete_netapp_resources function with mocked clients"""
-    # This is a placeholder test - in a real scenario, you would mock the Azure clients
-    # and test the deletion logic more thoroughly
-    pass
+    account_id = (
+        "/subscriptions/sub-id/resourceGroups/test-rg"
+        "/providers/Microsoft.NetApp/netAppAccounts/test-account"
+    )
+
+    # Mock a pool with two volumes and a vault with one backup
+    mock_pool = MagicMock()
+    mock_pool.name = "test-account/test-pool"
+    mock_volumes = [MagicMock(), MagicMock()]
+    mock_volumes[0].name = "test-account/test-pool/volume-1"
+    mock_volumes[1].name = "test-account/test-pool/volume-2"
+    mock_vault = MagicMock()
+    mock_vault.name = "test-account/test-vault"
+    mock_backup = MagicMock()
+    mock_backup.name = "test-account/test-vault/backup-1"
+
+    mock_netapp_client = MagicMock()
+    mock_netapp_client.pools.list.return_value = [mock_pool]
+    mock_netapp_client.volumes.list.return_value = mock_volumes
+    mock_netapp_client.backup_vaults.list_by_net_app_account.return_value = [mock_vault]
+    mock_netapp_client.backups.list_by_vault.return_value = [mock_backup]
+
+    # The resource group also holds a resource unrelated to the account
+    mock_other_resource = MagicMock()
+    mock_other_resource.id = (
+        "/subscriptions/sub-id/resourceGroups/test-rg"
+        "/providers/Microsoft.Storage/storageAccounts/other"
+    )
+    mock_resource_client = MagicMock()
+    mock_resource_client.resources.list_by_resource_group.return_value = [
+        mock_other_resource
+    ]
+
+    delete_netapp_resources(mock_netapp_client, mock_resource_client, account_id)
+
+    # Every volume and backup deletion should have been started and awaited
+    assert mock_netapp_client.volumes.begin_delete.call_count == 2
+    mock_netapp_client.volumes.list.assert_called_once_with(
+        "test-rg", "test-account", "test-pool"
+    )
+    mock_netapp_client.volumes.begin_delete.assert_any_call(
+        "test-rg", "test-account", "test-pool", "volume-1", polling=ANY
+    )
+    assert mock_netapp_client.volumes.begin_delete.return_value.result.call_count == 2
+    mock_netapp_client.backups.begin_delete.assert_called_once_with(
+        "test-rg",
+        "test-account",
+        "test-vault",
+        "backup-1",
+        polling=ANY,
+    )
+    mock_netapp_client.accounts.begin_delete.assert_called_once_with(
+        "test-rg", "test-account", polling=ANY
+    )
+    mock_resource_client.resource_groups.begin_delete.assert_called_once_with(
+        "test-rg", polling=ANY
+    )
+
+    # The vault isn't re-fetched after its delete succeeds unless asked to
+    mock_netapp_client.backup_vaults.get.assert_not_called()
+
+    # Each delete polls its status with its own backoff polling method
+    polling = mock_netapp_client.accounts.begin_delete.call_args.kwargs["polling"]
+    assert isinstance(polling, BackoffPolling)
+
+
+@patch("netapp_deleter.resource_deleter.logger")
+def test_delete_netapp_resources_dedicated_resource_group(mock_logger):
+    """Test that a resource group holding only the account is deleted directly"""
+    account_id = (
+        "/subscriptions/sub-id/resourceGroups/test-rg"
+        "/providers/Microsoft.NetApp/netAppAccounts/test-account"
+    )
+    mock_account = MagicMock()
+    mock_account.id = account_id
+    mock_pool = MagicMock()
+    mock_pool.id = account_id + "/capacityPools/test-pool"
+
+    mock_netapp_client = MagicMock()
+    mock_resource_client = MagicMock()
+    mock_resource_client.resources.list_by_resource_group.return_value = [
+        mock_account,
+        mock_pool,
+    ]
+
+    delete_netapp_resources(mock_netapp_client, mock_resource_client, account_id)
+
+    # Only the resource group is deleted; nothing in the account is touched
+    mock_resource_client.resource_groups.begin_delete.assert_called_once_with(
+        "test-rg", polling=ANY
+    )
+    mock_netapp_client.pools.list.assert_not_called()
+    mock_netapp_client.accounts.begin_delete.assert_not_called()
+
+
+@patch("netapp_deleter.resource_deleter.logger")
+def test_delete_backup_vault_verify_deletion(mock_logger):
+    """Test that an opted-in verification catches a vault that still exists"""
+    mock_netapp_client = MagicMock()
+    mock_netapp_client.backups.list_by_vault.return_value = []
+    args = (mock_netapp_client, "test-rg", "test-account", "test-vault")
+
+    mock_netapp_client.backup_vaults.get.side_effect = ResourceNotFoundError()
+    _delete_backup_vault(*args, threading.Event(), verify_deletion=True)
+    mock_netapp_client.backup_vaults.get.assert_called_once_with(
+        "test-rg", "test-account", "test-vault"
+    )
+
+    mock_netapp_client.backup_vaults.get.side_effect = None
+    with pytest.raises(Exception, match="still exists"):
+        _delete_backup_vault(*args, threading.Event(), verify_deletion=True)
+
+
+def test_wait_for_poller_stops_when_cancelled():
+    """Test that waiting on a delete stops once cancellation is requested"""
+    mock_poller = MagicMock()
+    mock_poller.done.return_value = False
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    with pytest.raises(DeletionCancelledError):
+        _wait_for_poller(mock_poller, cancel_event)
+    mock_poller.result.assert_not_called()
+
+
+def test_wait_for_deletions_surfaces_failures_as_they_complete():
+    """Test that a failed delete is reported without waiting on earlier ones"""
+    slow_poller = MagicMock()
+    slow_poller.done.return_value = False
+    failed_poller = MagicMock()
+    failed_poller.done.return_value = True
+    failed_poller.result.side_effect = Exception("Delete failed")
+    pollers = [("slow-volume", slow_poller), ("failed-volume", failed_poller)]
+
+    with pytest.raises(Exception, match="Delete failed"):
+        _wait_for_deletions(pollers, "volume", threading.Event())
+    slow_poller.result.assert_not_called()
+
+
+def test_backoff_polling_delay():
+    """Test that the delay between LRO status polls grows up to a cap"""
+    polling = BackoffPolling()
+    polling._pipeline_response = MagicMock()
+    polling._pipeline_response.http_response.headers = {}
+
+    delays = [polling._extract_delay() for _ in range(12)]
+    assert delays[:3] == [2, 3, 4.5]
+    assert delays[-1] == 30
+
+
+def test_token_bucket():
+    """Test that the token bucket allows a burst and then paces requests"""
+    bucket = TokenBucket(capacity=2, refill_per_sec=20)
+
+    # The initial burst is served without waiting
+    start = time.monotonic()
+    bucket.acquire()
+    bucket.acquire()
+    assert time.monotonic() - start < 0.04
+
+    # Once empty, the next token takes a refill interval to arrive
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.04
+
+
+def test_parse_account_id():
+    """Test extracting the resource group and account name from an account ID"""
+    account_id = (
+        "/subscriptions/sub-id/resourceGroups/test-rg"
+        "/providers/Microsoft.NetApp/netAppAccounts/test-account"
+    )
+    assert _parse_account_id(account_id) == ("test-rg", "test-account")
+
+
+def test_account_delete_backoff():
+    """Test the retry classification and backoff delays for account deletion"""
+    assert _is_transient_error(
+        Exception("Cannot delete resource while nested resources exist")
+    )
+    assert not _is_transient_error(Exception("AuthorizationFailed"))
+
+    # Delays grow exponentially, stay within the jitter bound and are capped
+    assert 1 <= _backoff_delay(0) <= 1.5
+    assert 4 <= _backoff_delay(2) <= 6
+    assert _backoff_delay(10) == RETRY_MAX_DELAY
 
 
 @patch("netapp_deleter.app.logger")
@@ -76,3 +307,26 @@ def test_list_and_delete_netapp_accounts(mock_delete_resources, mock_logger):
 
     # Verify the function was called
     mock_netapp_client.accounts.list_by_subscription.assert_called_once()
+
+
+@patch("netapp_deleter.app.logger")
+@patch("netapp_deleter.app.delete_netapp_resources")
+def test_list_and_delete_netapp_accounts_streams_accounts(
+    mock_delete_resources, mock_logger
+):
+    """Test that accounts are deleted straight from the paged listing"""
+    mock_accounts = [MagicMock(), MagicMock()]
+    mock_accounts[0].id = "account-id-1"
+    mock_accounts[1].id = "account-id-2"
+
+    # Return a one-shot iterator, like the SDK's paged results
+    mock_netapp_client = MagicMock()
+    mock_netapp_client.accounts.list_by_subscription.return_value = iter(mock_accounts)
+    mock_resource_client = MagicMock()
+
+    list_and_delete_netapp_accounts(
+        mock_netapp_client, mock_resource_client, skip_confirmation=True, max_workers=2
+    )
+
+    deleted_ids = sorted(call.args[2] for call in mock_delete_resources.call_args_list)
+    assert deleted_ids == ["account-id-1", "account-id-2"]